@@ -7,7 +7,7 @@ A production-ready Model Context Protocol server for accessing Indian government
 __version__ = "1.0.0"
 __author__ = "Data.gov.in MCP Team"
 
-from .api_client import DataGovInClient
+from .api_client import DataGovInClient, DataGovInAsyncClient
 from .exceptions import (
     DataGovInException,
     APIKeyMissingError,
@@ -18,6 +18,7 @@ from .exceptions import (
 
 __all__ = [
     "DataGovInClient",
+    "DataGovInAsyncClient",
     "DataGovInException",
     "APIKeyMissingError",
     "RateLimitError",
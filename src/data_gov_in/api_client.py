@@ -3,13 +3,18 @@ API client for data.gov.in
 """
 
 import time
+import random
+import functools
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Any, Callable, Optional, List, Tuple, Hashable, TypeVar
 import httpx
+import orjson
 
 from .config import Config
-from .cache import Cache
+from .cache import Cache, CacheBackend, ErrorMarker, RedisCache
 from .exceptions import (
     APIKeyMissingError,
     RateLimitError,
@@ -20,41 +25,137 @@ from .exceptions import (
 )
 
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Records sampled by get_resource_fields when inferring field types
+FIELD_SAMPLE_SIZE = 20
+
+# Caps applied when pool sizes are derived from rate_limit_calls
+MAX_DERIVED_KEEPALIVE = 64
+MAX_DERIVED_CONNECTIONS = 128
+
+# Upper bound in seconds on any single retry backoff
+MAX_RETRY_DELAY = 30.0
+
+
+@functools.lru_cache(maxsize=512)
+def _url_for(resource_id: str) -> str:
+    """Build the API path for a resource, relative to the client's base_url"""
+    return f"/resource/{resource_id}"
+
+
+class _IncrementalJSONParser:
+    """Build a JSON document from byte chunks without holding the raw body"""
+
+    def __init__(self):
+        self._items = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._items, "", use_float=True)
 
-class RateLimiter:
-    """Simple rate limiter using sliding window"""
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the body"""
+        try:
+            self._coro.send(chunk)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
 
-    def __init__(self, max_calls: int, period: int):
+    def result(self) -> Dict[str, Any]:
+        """Finish parsing and return the document"""
+        try:
+            self._coro.close()
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        if not self._items:
+            raise ValueError("Empty response body")
+        return self._items[0]
+
+
+class _InflightCall:
+    """Result slot shared by threads waiting on the same in-flight request"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class _TokenBucket:
+    """
+    Token bucket shared by the sync and async rate limiters
+
+    Holds up to ``burst`` tokens (``max_calls`` by default), refilled
+    continuously at ``max_calls / period`` tokens per second. Each call
+    consumes one token; when the bucket is empty the caller waits until its
+    token has accrued.
+    """
+
+    def __init__(self, max_calls: int, period: int, burst: Optional[int] = None):
         self.max_calls = max_calls
         self.period = period
-        self.calls: List[float] = []
+        self.burst = max_calls if burst is None else burst
+        self.rate = max_calls / period
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+        # Tokens may go negative: the deficit is the queue of callers still waiting
+        self.tokens -= 1
+        if self.tokens < 0:
+            return -self.tokens / self.rate
+        return 0.0
+
+
+class RateLimiter(_TokenBucket):
+    """Token bucket rate limiter that blocks the calling thread while waiting"""
 
     def wait_if_needed(self) -> None:
         """Wait if rate limit would be exceeded"""
-        now = time.time()
-        # Remove calls outside the current window
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.period]
-
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.period - (now - self.calls[0])
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-                self.calls = []
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
+            time.sleep(sleep_time)
 
-        self.calls.append(time.time())
 
+class AsyncRateLimiter(_TokenBucket):
+    """
+    Token bucket rate limiter that yields to the event loop while waiting
 
-class DataGovInClient:
+    Reserving a token never awaits, so concurrent tasks on one loop cannot
+    interleave inside ``_reserve`` and no ``asyncio.Lock`` is needed.
     """
-    Client for interacting with data.gov.in API
 
-    This client provides methods to search, retrieve, and download datasets
-    from the Indian government's open data portal.
+    async def wait_if_needed(self) -> None:
+        """Wait if rate limit would be exceeded"""
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
+
+
+class _BaseClient:
+    """
+    Shared state and helpers for the sync and async data.gov.in clients
+
+    Subclasses provide the HTTP transport, the request loop, and anything
+    whose signature differs between sync and async (response handling that
+    touches the cache, the cache statistics and clearing methods).
     """
 
+    # Whether the in-memory cache must guard against concurrent threads
+    _thread_safe_cache = True
+
     def __init__(self, config: Optional[Config] = None):
         """
         Initialize the API client
@@ -63,27 +164,247 @@ class DataGovInClient:
             config: Configuration object. If None, loads from environment.
         """
         self.config = config or Config.from_env()
-        self.config.validate()
 
         if not self.config.api_key:
             logger.warning("API key not set. Some operations may fail.")
 
-        self.cache = Cache(
-            max_size=self.config.cache_max_size,
-            default_ttl=self.config.cache_ttl
-        ) if self.config.cache_enabled else None
+        self.cache: Optional[CacheBackend[Any]] = None
+        if self.config.cache_enabled:
+            if self.config.cache_backend == "redis":
+                self.cache = RedisCache(
+                    url=self.config.redis_url,
+                    default_ttl=self.config.cache_ttl
+                )
+            else:
+                self.cache = Cache(
+                    max_size=self.config.cache_max_size,
+                    default_ttl=self.config.cache_ttl,
+                    thread_safe=self._thread_safe_cache
+                )
+
+        # Query parameters sent with every request
+        self._default_params: Dict[str, Any] = {
+            "api-key": self.config.api_key,
+            "format": "json",
+        }
+
+        # Exponential backoff schedule: the delay before retry N is drawn
+        # uniformly from [0, _retry_delays[N]] ("full jitter") so clients that
+        # failed together don't all retry in the same wave
+        self._retry_delays = [
+            min(MAX_RETRY_DELAY, self.config.retry_delay * self.config.backoff_factor ** attempt)
+            for attempt in range(self.config.max_retries)
+        ]
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        """Default headers sent with every request"""
+        return {
+            "User-Agent": "data-gov-in-mcp/1.0.0",
+            "Accept": "application/json",
+        }
+
+    @property
+    def _limits(self) -> httpx.Limits:
+        """
+        Connection pool limits, sized from the rate limit unless configured
+
+        Matching pool capacity to the allowed request rate keeps callers queued
+        on the rate limiter rather than inside httpx; the caps stop very high
+        rate limits from opening an excessive number of sockets to one host.
+        """
+        max_keepalive = self.config.pool_max_keepalive
+        if max_keepalive is None:
+            max_keepalive = min(self.config.rate_limit_calls, MAX_DERIVED_KEEPALIVE)
+        max_connections = self.config.pool_max_connections
+        if max_connections is None:
+            max_connections = min(self.config.rate_limit_calls * 2, MAX_DERIVED_CONNECTIONS)
+        return httpx.Limits(
+            max_keepalive_connections=max_keepalive,
+            max_connections=max_connections,
+            keepalive_expiry=self.config.keepalive_expiry
+        )
+
+    def _request_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add authentication to the query parameters"""
+        if not self.config.api_key:
+            raise APIKeyMissingError()
+
+        # Merge into a new dict so the caller's params are never mutated
+        return {**self._default_params, **params} if params else self._default_params
+
+    def _cache_lookup(
+        self,
+        resource_id: str,
+        params: Dict[str, Any],
+        use_cache: bool
+    ) -> Tuple[Optional[Hashable], Optional[Dict[str, Any]]]:
+        """
+        Look up the cache for a request
+
+        Returns:
+            Tuple of (cache_key, cached_value); the key is None when caching is off
+        """
+        cache = self.cache
+        if not use_cache or cache is None:
+            return None, None
+        cache_key, cached = cache.get_by_params(resource_id, **params)
+        if cached is not None:
+            logger.debug(f"Cache hit for resource {resource_id}")
+        return cache_key, cached
+
+    @staticmethod
+    def _response_error(resource_id: str, response: httpx.Response) -> Optional[Exception]:
+        """Map an HTTP error status to the exception to raise, or None on success"""
+        if response.status_code == 404:
+            return ResourceNotFoundError(resource_id)
+        if response.status_code == 429:
+            return RateLimitError()
+        if not 200 <= response.status_code < 300:
+            return APIError(response.status_code, response.text)
+        return None
+
+    def _cache_error(self, cache_key: Optional[Hashable], error: Exception) -> None:
+        """Remember a failure briefly so repeated bad lookups skip the network"""
+        if cache_key is not None and self.cache is not None and self.config.negative_cache_ttl:
+            self.cache.set(cache_key, ErrorMarker(error), ttl=self.config.negative_cache_ttl)
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> Dict[str, Any]:
+        """
+        Decode a buffered JSON body with orjson rather than httpx's stdlib json
+
+        Raises:
+            ValueError: (orjson.JSONDecodeError) on a malformed body, which the
+                retry loop treats as retryable
+        """
+        return orjson.loads(response.content)
+
+    def _cache_result(self, cache_key: Optional[Hashable], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successful response"""
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(cache_key, data)
+        return data
+
+    def _should_stream(self, response: httpx.Response) -> bool:
+        """Whether a streamed response body is large enough to parse incrementally"""
+        if ijson is None or not response.is_success:
+            return False
+        content_length = response.headers.get("Content-Length")
+        # Bodies of unknown length are treated as large
+        return content_length is None or int(content_length) > self.config.streaming_threshold_bytes
+
+    def _resource_params(
+        self,
+        filters: Optional[Dict[str, str]],
+        offset: int,
+        limit: Optional[int]
+    ) -> Dict[str, Any]:
+        """Validate pagination arguments and build query parameters"""
+        limit = limit or self.config.default_limit
+        max_limit = self.config.max_limit
+        if not 1 <= limit <= max_limit:
+            raise InvalidParameterError("limit", f"Must be between 1 and {max_limit}")
+
+        params = {
+            "offset": offset,
+            "limit": limit,
+        }
+
+        # Add filters
+        if filters:
+            params["filters"] = filters
+
+        return params
+
+    @staticmethod
+    def extract_fields(data: Dict[str, Any]) -> List[Dict[str, str]]:
+        """
+        Get field definitions from a resource response
+
+        Uses the ``fields`` list when the API provides one, otherwise infers
+        each field's type as the most common non-null type across all the
+        records in the response, so callers that already hold a response
+        don't need a second request.
+
+        Args:
+            data: Response returned by ``get_resource``
+
+        Returns:
+            List of field definitions
+        """
+        if "fields" in data:
+            return data["fields"]
+
+        types: Dict[str, Counter] = defaultdict(Counter)
+        for record in data.get("records", []):
+            for key, value in record.items():
+                counts = types[key]
+                if value is not None:
+                    counts[type(value).__name__] += 1
+
+        return [
+            {"id": key, "type": counts.most_common(1)[0][0] if counts else "NoneType"}
+            for key, counts in types.items()
+        ]
+
+    def search_resources(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Search for resources (Note: This might require different API endpoint)
+
+        Args:
+            query: Search query string
+            offset: Number of results to skip
+            limit: Maximum number of results to return
+
+        Returns:
+            Search results
+        """
+        # Note: data.gov.in might not have a direct search API
+        # This is a placeholder implementation
+        logger.warning("Search functionality may not be directly available in data.gov.in API")
+        return {
+            "message": "Search functionality requires web scraping or catalog API access",
+            "query": query
+        }
+
+
+class DataGovInClient(_BaseClient):
+    """
+    Client for interacting with data.gov.in API
+
+    This client provides methods to search, retrieve, and download datasets
+    from the Indian government's open data portal.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        """
+        Initialize the API client
+
+        Args:
+            config: Configuration object. If None, loads from environment.
+        """
+        super().__init__(config)
 
         self.rate_limiter = RateLimiter(
             max_calls=self.config.rate_limit_calls,
             period=self.config.rate_limit_period
         )
 
+        self._inflight: Dict[Hashable, _InflightCall] = {}
+        self._inflight_lock = threading.Lock()
+
         self.client = httpx.Client(
+            base_url=self.config.base_url,
             timeout=self.config.timeout,
-            headers={
-                "User-Agent": "data-gov-in-mcp/1.0.0",
-                "Accept": "application/json",
-            }
+            http2=self.config.http2,
+            headers=self._headers,
+            limits=self._limits
         )
 
     def __enter__(self):
@@ -96,9 +417,52 @@ class DataGovInClient:
         """Close the HTTP client"""
         self.client.close()
 
-    def _build_url(self, resource_id: str) -> str:
-        """Build API URL for a resource"""
-        return urljoin(self.config.base_url, f"/resource/{resource_id}")
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get cache statistics"""
+        if self.cache is not None:
+            return self.cache.stats()
+        return None
+
+    def clear_cache(self) -> None:
+        """Clear all cached data"""
+        if self.cache is not None:
+            self.cache.clear()
+            logger.info("Cache cleared")
+
+    def _handle_response(
+        self,
+        resource_id: str,
+        response: httpx.Response,
+        cache_key: Optional[Hashable]
+    ) -> Dict[str, Any]:
+        """Map HTTP errors to exceptions, then parse and cache the response"""
+        error = self._response_error(resource_id, response)
+        if error is not None:
+            self._cache_error(cache_key, error)
+            raise error
+
+        return self._cache_result(cache_key, self._parse(response))
+
+    def _get(
+        self,
+        resource_id: str,
+        url: str,
+        params: Dict[str, Any],
+        cache_key: Optional[Hashable]
+    ) -> Dict[str, Any]:
+        """Issue a single GET, streaming large bodies when enabled"""
+        if not self.config.streaming_threshold_bytes:
+            response = self.client.get(url, params=params)
+            return self._handle_response(resource_id, response, cache_key)
+
+        with self.client.stream("GET", url, params=params) as response:
+            if self._should_stream(response):
+                parser = _IncrementalJSONParser()
+                for chunk in response.iter_bytes():
+                    parser.feed(chunk)
+                return self._cache_result(cache_key, parser.result())
+            response.read()
+            return self._handle_response(resource_id, response, cache_key)
 
     def _make_request(
         self,
@@ -120,70 +484,82 @@ class DataGovInClient:
         Raises:
             Various exceptions based on error type
         """
-        if not self.config.api_key:
-            raise APIKeyMissingError()
-
-        # Prepare parameters
-        params = params or {}
-        params["api-key"] = self.config.api_key
-        params.setdefault("format", "json")
-
-        # Check cache
-        if use_cache and self.cache:
-            cache_key = self.cache._make_key(resource_id, **params)
-            cached = self.cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Cache hit for resource {resource_id}")
-                return cached
-
+        params = self._request_params(params)
+        cache_key, cached = self._cache_lookup(resource_id, params, use_cache)
+        if cached is not None:
+            return cached
+        if cache_key is None:
+            return self._fetch(resource_id, params, cache_key)
+
+        # Coalesce concurrent misses for the same key into a single request
+        inflight, inflight_lock = self._inflight, self._inflight_lock
+        with inflight_lock:
+            existing = inflight.get(cache_key)
+            if existing is None:
+                call = inflight[cache_key] = _InflightCall()
+
+        if existing is not None:
+            logger.debug(f"Waiting for in-flight request for resource {resource_id}")
+            existing.done.wait()
+            if existing.error is not None:
+                raise existing.error
+            assert existing.result is not None
+            return existing.result
+
+        try:
+            data = self._fetch(resource_id, params, cache_key)
+            call.result = data
+            return data
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with inflight_lock:
+                del inflight[cache_key]
+            call.done.set()
+
+    def _fetch(
+        self,
+        resource_id: str,
+        params: Dict[str, Any],
+        cache_key: Optional[Hashable]
+    ) -> Dict[str, Any]:
+        """Rate-limit, then request the resource with retries"""
         # Rate limiting
         self.rate_limiter.wait_if_needed()
 
-        # Make request with retries
-        url = self._build_url(resource_id)
+        # Make request with retries; bind hot attributes once per call
+        url = _url_for(resource_id)
+        get = self._get
+        retry_delays = self._retry_delays
+        retries = len(retry_delays)
+        debug = logger.isEnabledFor(logging.DEBUG)
         last_exception = None
 
-        for attempt in range(self.config.max_retries + 1):
+        # HTTP error statuses raise straight out of _get and are not retried;
+        # only transport failures and malformed bodies reach the handlers below
+        attempts = retries + 1
+        for attempt in range(attempts):
             try:
-                logger.debug(f"Request to {url} (attempt {attempt + 1}/{self.config.max_retries + 1})")
-                response = self.client.get(url, params=params)
-
-                # Handle HTTP errors
-                if response.status_code == 404:
-                    raise ResourceNotFoundError(resource_id)
-                elif response.status_code == 429:
-                    raise RateLimitError()
-                elif response.status_code >= 400:
-                    raise APIError(response.status_code, response.text)
-
-                response.raise_for_status()
-                data = response.json()
-
-                # Cache successful response
-                if use_cache and self.cache:
-                    self.cache.set(cache_key, data)
-
-                return data
+                if debug:
+                    logger.debug(f"Request to {url} (attempt {attempt + 1}/{attempts})")
+                return get(resource_id, url, params, cache_key)
 
             except httpx.TimeoutException as e:
                 last_exception = NetworkError(f"Request timeout: {str(e)}")
                 logger.warning(f"Timeout on attempt {attempt + 1}: {e}")
 
-            except httpx.NetworkError as e:
+            except httpx.TransportError as e:
                 last_exception = NetworkError(f"Network error: {str(e)}")
                 logger.warning(f"Network error on attempt {attempt + 1}: {e}")
 
-            except (APIError, RateLimitError, ResourceNotFoundError):
-                # Don't retry these errors
-                raise
-
-            except Exception as e:
-                last_exception = APIError(500, f"Unexpected error: {str(e)}")
-                logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
+            except ValueError as e:
+                last_exception = APIError(500, f"Invalid JSON response: {str(e)}")
+                logger.error(f"Invalid response on attempt {attempt + 1}: {e}")
 
-            # Wait before retry with exponential backoff
-            if attempt < self.config.max_retries:
-                sleep_time = self.config.retry_delay * (self.config.backoff_factor ** attempt)
+            # Wait before retry with jittered exponential backoff
+            if attempt < retries:
+                sleep_time = random.uniform(0, retry_delays[attempt])
                 logger.debug(f"Retrying in {sleep_time:.2f} seconds...")
                 time.sleep(sleep_time)
 
@@ -213,19 +589,7 @@ class DataGovInClient:
             >>> client = DataGovInClient()
             >>> data = client.get_resource("9ef84268-d588-465a-a308-a864a43d0070", limit=5)
         """
-        limit = limit or self.config.default_limit
-        if limit > self.config.max_limit:
-            raise InvalidParameterError("limit", f"Cannot exceed {self.config.max_limit}")
-
-        params = {
-            "offset": offset,
-            "limit": limit,
-        }
-
-        # Add filters
-        if filters:
-            params["filters"] = filters
-
+        params = self._resource_params(filters, offset, limit)
         return self._make_request(resource_id, params)
 
     def get_resource_fields(self, resource_id: str) -> List[Dict[str, str]]:
@@ -238,53 +602,279 @@ class DataGovInClient:
         Returns:
             List of field definitions
         """
-        data = self._make_request(resource_id, {"limit": 1})
+        limit = min(FIELD_SAMPLE_SIZE, self.config.max_limit)
+        data = self._make_request(resource_id, {"limit": limit})
+        return self.extract_fields(data)
 
-        if "fields" in data:
-            return data["fields"]
-        elif "records" in data and len(data["records"]) > 0:
-            # Infer fields from first record
-            first_record = data["records"][0]
-            return [
-                {"id": key, "type": type(value).__name__}
-                for key, value in first_record.items()
-            ]
+
+class DataGovInAsyncClient(_BaseClient):
+    """
+    Asynchronous client for interacting with data.gov.in API
+
+    Uses a single pooled ``httpx.AsyncClient`` so concurrent tool calls share
+    keep-alive connections and overlap their network I/O. Like the
+    ``httpx.AsyncClient`` itself, an instance belongs to one event loop.
+    """
+
+    # Cache access never spans an await, so tasks on the loop can't interleave
+    _thread_safe_cache = False
+
+    def __init__(self, config: Optional[Config] = None):
+        """
+        Initialize the API client
+
+        Args:
+            config: Configuration object. If None, loads from environment.
+        """
+        super().__init__(config)
+
+        self.rate_limiter = AsyncRateLimiter(
+            max_calls=self.config.rate_limit_calls,
+            period=self.config.rate_limit_period
+        )
+
+        self._inflight: Dict[Hashable, "asyncio.Task[Dict[str, Any]]"] = {}
+
+        self.client = httpx.AsyncClient(
+            base_url=self.config.base_url,
+            timeout=self.config.timeout,
+            http2=self.config.http2,
+            headers=self._headers,
+            limits=self._limits
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP client"""
+        await self.client.aclose()
+
+    async def _get(
+        self,
+        resource_id: str,
+        url: str,
+        params: Dict[str, Any],
+        cache_key: Optional[Hashable]
+    ) -> Dict[str, Any]:
+        """Issue a single GET, streaming large bodies when enabled"""
+        if not self.config.streaming_threshold_bytes:
+            response = await self.client.get(url, params=params)
+            return await self._handle_response(resource_id, response, cache_key)
+
+        async with self.client.stream("GET", url, params=params) as response:
+            if self._should_stream(response):
+                parser = _IncrementalJSONParser()
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                return await self._run_cache(self._cache_result, cache_key, parser.result())
+            await response.aread()
+            return await self._handle_response(resource_id, response, cache_key)
+
+    async def _handle_response(
+        self,
+        resource_id: str,
+        response: httpx.Response,
+        cache_key: Optional[Hashable]
+    ) -> Dict[str, Any]:
+        """Map HTTP errors to exceptions, then parse and cache the response"""
+        error = self._response_error(resource_id, response)
+        if error is not None:
+            await self._run_cache(self._cache_error, cache_key, error)
+            raise error
+
+        return await self._run_cache(self._cache_result, cache_key, self._parse(response))
+
+    async def _run_cache(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a cache operation without blocking the event loop
+
+        The in-memory cache is called inline. Network-backed caches (Redis)
+        use a blocking client, so their calls run in a worker thread.
+        """
+        if isinstance(self.cache, RedisCache):
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get cache statistics"""
+        if self.cache is not None:
+            return await self._run_cache(self.cache.stats)
+        return None
+
+    async def clear_cache(self) -> None:
+        """Clear all cached data"""
+        if self.cache is not None:
+            await self._run_cache(self.cache.clear)
+            logger.info("Cache cleared")
+
+    async def _make_request(
+        self,
+        resource_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to the API with retries and error handling
+
+        Args:
+            resource_id: Resource identifier
+            params: Query parameters
+            use_cache: Whether to use cache
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            Various exceptions based on error type
+        """
+        params = self._request_params(params)
+        cache_key, cached = await self._run_cache(
+            self._cache_lookup, resource_id, params, use_cache
+        )
+        if cached is not None:
+            return cached
+        if cache_key is None:
+            return await self._fetch(resource_id, params, cache_key)
+
+        # Coalesce concurrent misses for the same key into a single request.
+        # The fetch runs as its own task that every caller, leader included,
+        # awaits through a shield, so cancelling one caller never cancels the
+        # request (or the result) for the others
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(resource_id, params, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, cache_key))
         else:
-            return []
+            logger.debug(f"Waiting for in-flight request for resource {resource_id}")
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, cache_key: Hashable, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        """Drop a finished fetch from the in-flight map"""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        # Mark any exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        resource_id: str,
+        params: Dict[str, Any],
+        cache_key: Optional[Hashable]
+    ) -> Dict[str, Any]:
+        """Rate-limit, then request the resource with retries"""
+        # Rate limiting
+        await self.rate_limiter.wait_if_needed()
+
+        # Make request with retries; bind hot attributes once per call
+        url = _url_for(resource_id)
+        get = self._get
+        retry_delays = self._retry_delays
+        retries = len(retry_delays)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        last_exception = None
 
-    def search_resources(
+        # HTTP error statuses raise straight out of _get and are not retried;
+        # only transport failures and malformed bodies reach the handlers below
+        attempts = retries + 1
+        for attempt in range(attempts):
+            try:
+                if debug:
+                    logger.debug(f"Request to {url} (attempt {attempt + 1}/{attempts})")
+                return await get(resource_id, url, params, cache_key)
+
+            except httpx.TimeoutException as e:
+                last_exception = NetworkError(f"Request timeout: {str(e)}")
+                logger.warning(f"Timeout on attempt {attempt + 1}: {e}")
+
+            except httpx.TransportError as e:
+                last_exception = NetworkError(f"Network error: {str(e)}")
+                logger.warning(f"Network error on attempt {attempt + 1}: {e}")
+
+            except ValueError as e:
+                last_exception = APIError(500, f"Invalid JSON response: {str(e)}")
+                logger.error(f"Invalid response on attempt {attempt + 1}: {e}")
+
+            # Wait before retry with jittered exponential backoff
+            if attempt < retries:
+                sleep_time = random.uniform(0, retry_delays[attempt])
+                logger.debug(f"Retrying in {sleep_time:.2f} seconds...")
+                await asyncio.sleep(sleep_time)
+
+        # All retries failed
+        raise last_exception or NetworkError("All retry attempts failed")
+
+    async def get_resource(
         self,
-        query: str,
+        resource_id: str,
+        filters: Optional[Dict[str, str]] = None,
         offset: int = 0,
-        limit: int = 10
+        limit: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Search for resources (Note: This might require different API endpoint)
+        Get data from a specific resource
 
         Args:
-            query: Search query string
-            offset: Number of results to skip
-            limit: Maximum number of results to return
+            resource_id: Unique identifier for the resource/dataset
+            filters: Optional filters to apply to the data
+            offset: Number of records to skip (pagination)
+            limit: Maximum number of records to return
 
         Returns:
-            Search results
+            Dictionary containing the resource data
+
+        Example:
+            >>> async with DataGovInAsyncClient() as client:
+            ...     data = await client.get_resource(
+            ...         "9ef84268-d588-465a-a308-a864a43d0070", limit=5
+            ...     )
         """
-        # Note: data.gov.in might not have a direct search API
-        # This is a placeholder implementation
-        logger.warning("Search functionality may not be directly available in data.gov.in API")
-        return {
-            "message": "Search functionality requires web scraping or catalog API access",
-            "query": query
-        }
+        params = self._resource_params(filters, offset, limit)
+        return await self._make_request(resource_id, params)
 
-    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
-        """Get cache statistics"""
-        if self.cache:
-            return self.cache.stats()
-        return None
+    async def get_many(
+        self,
+        resource_ids: List[str],
+        filters: Optional[Dict[str, str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get data from several resources concurrently
 
-    def clear_cache(self) -> None:
-        """Clear all cached data"""
-        if self.cache:
-            self.cache.clear()
-            logger.info("Cache cleared")
+        Requests overlap on the pooled connection while the shared rate
+        limiter still paces them. The first failure is raised.
+
+        Args:
+            resource_ids: Resource identifiers to fetch
+            filters: Optional filters applied to every resource
+            offset: Number of records to skip (pagination)
+            limit: Maximum number of records to return per resource
+
+        Returns:
+            Resource data in the same order as ``resource_ids``
+        """
+        # Validate once up front so a bad limit fails before any request starts
+        params = self._resource_params(filters, offset, limit)
+        return await asyncio.gather(
+            *(self._make_request(resource_id, params) for resource_id in resource_ids)
+        )
+
+    async def get_resource_fields(self, resource_id: str) -> List[Dict[str, str]]:
+        """
+        Get field information for a resource
+
+        Args:
+            resource_id: Unique identifier for the resource
+
+        Returns:
+            List of field definitions
+        """
+        limit = min(FIELD_SAMPLE_SIZE, self.config.max_limit)
+        data = await self._make_request(resource_id, {"limit": limit})
+        return self.extract_fields(data)
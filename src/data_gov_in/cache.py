@@ -3,89 +3,397 @@ Caching layer for API responses
 """
 
 import time
+import heapq
 import hashlib
-import json
-from typing import Optional, Any, Dict
+import itertools
+import logging
+from typing import Optional, Any, Dict, Hashable, List, Tuple, Protocol, TypeVar
 from collections import OrderedDict
+from contextlib import nullcontext
 from threading import Lock
+from types import ModuleType
+
+import orjson
+
+try:
+    import redis as _redis
+    redis: Optional[ModuleType] = _redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+# Keys requested per SCAN round trip when RedisCache.clear walks its prefix
+REDIS_SCAN_BATCH_SIZE = 1000
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert dicts and lists (e.g. filter params) into hashable equivalents"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 class CacheEntry:
     """Represents a cached entry with TTL"""
 
+    # No per-entry __dict__; a full cache holds max_size of these
+    __slots__ = ("value", "expires_at")
+
     def __init__(self, value: Any, ttl: int):
         self.value = value
-        self.expiry = time.time() + ttl
+        # Monotonic clock so wall-clock adjustments can't mass-expire entries
+        self.expires_at = time.monotonic() + ttl
 
     def is_expired(self) -> bool:
         """Check if cache entry has expired"""
-        return time.time() > self.expiry
+        return time.monotonic() >= self.expires_at
+
+
+class ErrorMarker:
+    """Cached stand-in for a failed request; ``Cache.get`` re-raises the error"""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class CacheBackend(Protocol[K]):
+    """
+    Interface shared by the cache implementations used by the API clients
+
+    Generic over the key type returned by ``get_by_params``: tuples for
+    ``Cache``, prefixed strings for ``RedisCache``.
+    """
+
+    def get_by_params(self, *args, **kwargs) -> Tuple[K, Optional[Any]]: ...
+
+    def get(self, key: K) -> Optional[Any]: ...
+
+    def set(self, key: K, value: Any, ttl: Optional[int] = None) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+
+class _CacheShard:
+    """
+    One independently locked LRU partition of a ``Cache``
+
+    Alongside the LRU order, a min-heap of ``(expires_at, seq, key)`` lets a
+    full shard drop already-expired entries before evicting live ones.
+    Heap items for keys that were since updated or removed are skipped when
+    popped, and the heap is rebuilt if such stale items pile up. Misses also
+    drain a few expired items, so dead entries don't linger until the shard
+    fills up.
+    """
+
+    # Heap items examined per miss, bounding the cleanup work of a single get
+    DRAIN_ON_MISS = 16
+
+    def __init__(self, max_size: int, thread_safe: bool = True):
+        self.max_size = max_size
+        self.entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.expiry_heap: List[Tuple[float, int, Hashable]] = []
+        # Tie-breaker so the heap never has to compare keys
+        self._seq = itertools.count()
+        # nullcontext keeps the `with self.lock:` blocks but skips the acquire
+        self.lock = Lock() if thread_safe else nullcontext()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get a live entry, updating recency and hit/miss counters"""
+        with self.lock:
+            now = time.monotonic()
+            entry = self.entries.get(key)
+            # Same test as CacheEntry.is_expired, inlined to save a method call
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                self._evict_expired(now, limit=self.DRAIN_ON_MISS)
+                return None
+            # Move to end (most recently used)
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        """Store an entry, evicting expired entries first and then LRU ones if full"""
+        with self.lock:
+            if key in self.entries:
+                # Update in place rather than delete and re-insert
+                self.entries.move_to_end(key)
+            self.entries[key] = entry
+            heapq.heappush(self.expiry_heap, (entry.expires_at, next(self._seq), key))
+
+            if len(self.entries) > self.max_size:
+                self._evict_expired(time.monotonic())
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+            if len(self.expiry_heap) > 2 * max(self.max_size, 1):
+                self._rebuild_heap()
+
+    def _evict_expired(self, now: float, limit: Optional[int] = None) -> None:
+        """Remove entries whose expiry time has passed, popping at most ``limit`` heap items"""
+        heap = self.expiry_heap
+        popped = 0
+        while heap and heap[0][0] <= now and (limit is None or popped < limit):
+            popped += 1
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            # Skip heap items left behind by updates or LRU evictions
+            if entry is not None and entry.expires_at == expires_at:
+                del self.entries[key]
+
+    def _rebuild_heap(self) -> None:
+        """Drop stale heap items by rebuilding from the live entries"""
+        self.expiry_heap = [
+            (entry.expires_at, next(self._seq), key) for key, entry in self.entries.items()
+        ]
+        heapq.heapify(self.expiry_heap)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        with self.lock:
+            self.entries.clear()
+            self.expiry_heap.clear()
+            self.hits = 0
+            self.misses = 0
 
 
 class Cache:
-    """Thread-safe LRU cache with TTL support"""
+    """
+    Thread-safe LRU cache with TTL support
+
+    Entries are spread over up to ``shards`` partitions, each with its own lock,
+    so concurrent lookups of different keys rarely contend. LRU eviction is
+    per shard. Small caches use a single shard, which keeps eviction exact.
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
+    Pass ``thread_safe=False`` when the cache is only touched from one thread
+    (e.g. one event loop): locking is skipped, and with no contention to
+    spread there is a single shard.
+    """
+
+    # A cache is only split when every shard can hold at least this many entries
+    MIN_SHARD_SIZE = 32
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        shards: int = 16,
+        thread_safe: bool = True
+    ):
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = Lock()
+        if not thread_safe:
+            shards = 1
+
+        # Use a power of two so the shard index is a mask instead of a modulo
+        count = 1
+        while count * 2 <= min(shards, max_size // self.MIN_SHARD_SIZE):
+            count *= 2
+        self._mask = count - 1
+        # Spread max_size across shards so the total capacity stays exact
+        base, extra = divmod(max_size, count)
+        self._shards = [_CacheShard(base + (i < extra), thread_safe) for i in range(count)]
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def _shard(self, key: Hashable) -> _CacheShard:
+        return self._shards[hash(key) & self._mask]
+
+    @staticmethod
+    def _make_key(*args, hashed: bool = False, **kwargs) -> Hashable:
+        """
+        Generate cache key from arguments
+
+        Returns a hashable ``(args, frozenset(kwargs))`` tuple that can be used
+        directly as a dictionary key. The frozenset makes keyword order
+        irrelevant without sorting; no strings are formatted on this path.
+        The tuple itself is kept rather than ``hash(tuple)``: an int key would
+        let two different queries collide and serve each other's data.
+        Pass ``hashed=True`` to get a short 128-bit BLAKE2b hex string instead,
+        e.g. for backends that need string keys.
+        """
+        frozen_args = _freeze(args)
+        items = [(k, _freeze(v)) for k, v in kwargs.items()]
+        if hashed:
+            # Set iteration order varies between processes, so sort here to
+            # keep the digest stable; the frozen values (no dicts) have a
+            # canonical repr, which avoids a JSON round trip
+            buf = b"\x1f".join(
+                [repr(frozen_args).encode()] + [f"{k}={v!r}".encode() for k, v in sorted(items)]
+            )
+            return hashlib.blake2b(buf, digest_size=16).hexdigest()
+        return frozen_args, frozenset(items)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get value from cache if exists and not expired
+
+        Raises:
+            The cached exception if the key holds an ``ErrorMarker``
+        """
+        entry = self._shard(key).get(key)
+        if entry is None:
+            return None
+
+        value = entry.value
+        if isinstance(value, ErrorMarker):
+            # Reset the traceback so repeated raises don't keep extending it
+            raise value.error.with_traceback(None)
+        return value
+
+    def get_by_params(self, *args, **kwargs) -> Tuple[Hashable, Optional[Any]]:
+        """
+        Build the key for the given arguments and look it up in one call
+
+        The key is computed before any shard lock is taken; callers keep it to
+        ``set`` the value on a miss.
+
+        Returns:
+            Tuple of (key, cached value or None)
+        """
+        key = self._make_key(*args, **kwargs)
+        return key, self.get(key)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache with TTL; ``value`` may be an ``ErrorMarker``"""
+        if ttl is None:
+            ttl = self.default_ttl
+        self._shard(key).set(key, CacheEntry(value, ttl))
+
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics from the shards' running counters"""
+        hits = misses = size = 0
+        for shard in self._shards:
+            hits += shard.hits
+            misses += shard.misses
+            size += len(shard.entries)
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
+        return {
+            "backend": "memory",
+            "size": size,
+            "max_size": self.max_size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": f"{hit_rate:.2f}%"
+        }
+
+
+class RedisCache:
+    """
+    Redis-backed cache shared across processes and restarts
+
+    Values are stored as orjson-encoded bytes with ``SETEX``. Keys are hashed
+    and namespaced with ``prefix`` so several deployments can share a server.
+    Cached errors (``ErrorMarker``) are not written to Redis. Redis failures
+    and values that fail to decode are logged and treated as cache misses. The client is blocking;
+    ``DataGovInAsyncClient`` runs its calls in a worker thread.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        default_ttl: int = 3600,
+        prefix: str = "data-gov-in:",
+        client: Optional[Any] = None
+    ):
+        if client is None:
+            if redis is None:
+                raise ImportError(
+                    "The redis cache backend requires the 'redis' package "
+                    "(pip install data-gov-in-mcp[redis])"
+                )
+            client = redis.Redis.from_url(url)
+        self._redis = client
+        self.default_ttl = default_ttl
+        self.prefix = prefix
         self._hits = 0
         self._misses = 0
 
     def _make_key(self, *args, **kwargs) -> str:
-        """Generate cache key from arguments"""
-        key_dict = {
-            "args": args,
-            "kwargs": sorted(kwargs.items())
-        }
-        key_str = json.dumps(key_dict, sort_keys=True, default=str)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        """Generate a namespaced string key from arguments"""
+        return self.prefix + str(Cache._make_key(*args, hashed=True, **kwargs))
+
+    def get_by_params(self, *args, **kwargs) -> Tuple[str, Optional[Any]]:
+        """Build the key for the given arguments and look it up in one call"""
+        key = self._make_key(*args, **kwargs)
+        return key, self.get(key)
 
     def get(self, key: str) -> Optional[Any]:
-        """Get value from cache if exists and not expired"""
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if entry.is_expired():
-                    del self._cache[key]
-                    self._misses += 1
-                    return None
-                # Move to end (most recently used)
-                self._cache.move_to_end(key)
-                self._hits += 1
-                return entry.value
+        """Get value from Redis if present"""
+        try:
+            raw = self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            raw = None
+        if raw is None:
+            self._misses += 1
+            return None
+        try:
+            value = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Discarding undecodable Redis cache value for {key}: {e}")
             self._misses += 1
             return None
+        self._hits += 1
+        return value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache with TTL"""
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-            elif len(self._cache) >= self.max_size:
-                # Remove least recently used
-                self._cache.popitem(last=False)
-
-            ttl = ttl or self.default_ttl
-            self._cache[key] = CacheEntry(value, ttl)
+        """Set value in Redis with TTL"""
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl <= 0 or isinstance(value, ErrorMarker):
+            return
+        try:
+            self._redis.setex(key, ttl, orjson.dumps(value))
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
 
     def clear(self) -> None:
-        """Clear all cache entries"""
-        with self._lock:
-            self._cache.clear()
-            self._hits = 0
-            self._misses = 0
+        """Delete all keys under this cache's prefix"""
+        try:
+            keys = list(self._redis.scan_iter(match=f"{self.prefix}*", count=REDIS_SCAN_BATCH_SIZE))
+            if keys:
+                self._redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+        self._hits = 0
+        self._misses = 0
 
     def stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
-        with self._lock:
-            total = self._hits + self._misses
-            hit_rate = (self._hits / total * 100) if total > 0 else 0
-            return {
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate": f"{hit_rate:.2f}%"
-            }
+        """
+        Get cache statistics; hits and misses are counted per process
+
+        Constant time and no Redis round trip: ``size`` is reported as None,
+        because Redis has no per-prefix count (a SCAN would walk the whole
+        keyspace) and a maintained counter would drift as keys expire.
+        """
+        total = self._hits + self._misses
+        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        return {
+            "backend": "redis",
+            "size": None,
+            "max_size": None,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": f"{hit_rate:.2f}%"
+        }
@@ -3,20 +3,66 @@ Configuration management for data.gov.in MCP server
 """
 
 import os
-from typing import Optional
+import functools
+from typing import Any, Callable, Optional, Literal, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+def _bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _optional_int(value: str) -> Optional[int]:
+    return int(value) if value else None
+
+
+# (environment variable, Config attribute, converter) read by Config.from_env;
+# unset variables fall back to the dataclass defaults
+_ENV_SCHEMA: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ("DATA_GOV_IN_API_KEY", "api_key", str),
+    ("DATA_GOV_IN_BASE_URL", "base_url", str),
+    ("DATA_GOV_IN_TIMEOUT", "timeout", int),
+    ("DATA_GOV_IN_HTTP2", "http2", _bool),
+    ("DATA_GOV_IN_POOL_MAX_KEEPALIVE", "pool_max_keepalive", _optional_int),
+    ("DATA_GOV_IN_POOL_MAX_CONNECTIONS", "pool_max_connections", _optional_int),
+    ("DATA_GOV_IN_KEEPALIVE_EXPIRY", "keepalive_expiry", float),
+    ("DATA_GOV_IN_STREAMING_THRESHOLD_BYTES", "streaming_threshold_bytes", int),
+    ("DATA_GOV_IN_RATE_LIMIT_CALLS", "rate_limit_calls", int),
+    ("DATA_GOV_IN_RATE_LIMIT_PERIOD", "rate_limit_period", int),
+    ("DATA_GOV_IN_CACHE_ENABLED", "cache_enabled", _bool),
+    ("DATA_GOV_IN_CACHE_TTL", "cache_ttl", int),
+    ("DATA_GOV_IN_CACHE_MAX_SIZE", "cache_max_size", int),
+    ("DATA_GOV_IN_NEGATIVE_CACHE_TTL", "negative_cache_ttl", int),
+    ("DATA_GOV_IN_CACHE_BACKEND", "cache_backend", str.lower),
+    ("DATA_GOV_IN_REDIS_URL", "redis_url", str),
+    ("DATA_GOV_IN_LOG_LEVEL", "log_level", str),
+    ("DATA_GOV_IN_MAX_RETRIES", "max_retries", int),
+    ("DATA_GOV_IN_RETRY_DELAY", "retry_delay", float),
+    ("DATA_GOV_IN_BACKOFF_FACTOR", "backoff_factor", float),
+    ("DATA_GOV_IN_DEFAULT_LIMIT", "default_limit", int),
+    ("DATA_GOV_IN_MAX_LIMIT", "max_limit", int),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration settings for the MCP server"""
+    """Configuration settings for the MCP server, validated on construction"""
 
     # API Configuration
     api_key: Optional[str] = None
     base_url: str = "https://api.data.gov.in"
     timeout: int = 30
 
+    # Connection Pooling
+    http2: bool = True
+    pool_max_keepalive: Optional[int] = None  # defaults to rate_limit_calls, capped at 64
+    pool_max_connections: Optional[int] = None  # defaults to 2 * rate_limit_calls, capped at 128
+    keepalive_expiry: float = 60.0  # seconds
+
+    # Streaming: parse bodies larger than this incrementally (needs ijson); 0 disables
+    streaming_threshold_bytes: int = 0
+
     # Rate Limiting
     rate_limit_calls: int = 100
     rate_limit_period: int = 60  # seconds
@@ -25,6 +71,9 @@ class Config:
     cache_enabled: bool = True
     cache_ttl: int = 3600  # 1 hour
     cache_max_size: int = 1000
+    negative_cache_ttl: int = 30  # seconds to remember failed lookups; 0 disables
+    cache_backend: Literal["memory", "redis"] = "memory"
+    redis_url: str = "redis://localhost:6379/0"
 
     # Logging
     log_level: str = "INFO"
@@ -41,23 +90,19 @@ class Config:
 
     @classmethod
     def from_env(cls) -> "Config":
-        """Create configuration from environment variables"""
-        return cls(
-            api_key=os.getenv("DATA_GOV_IN_API_KEY"),
-            base_url=os.getenv("DATA_GOV_IN_BASE_URL", "https://api.data.gov.in"),
-            timeout=int(os.getenv("DATA_GOV_IN_TIMEOUT", "30")),
-            rate_limit_calls=int(os.getenv("DATA_GOV_IN_RATE_LIMIT_CALLS", "100")),
-            rate_limit_period=int(os.getenv("DATA_GOV_IN_RATE_LIMIT_PERIOD", "60")),
-            cache_enabled=os.getenv("DATA_GOV_IN_CACHE_ENABLED", "true").lower() == "true",
-            cache_ttl=int(os.getenv("DATA_GOV_IN_CACHE_TTL", "3600")),
-            cache_max_size=int(os.getenv("DATA_GOV_IN_CACHE_MAX_SIZE", "1000")),
-            log_level=os.getenv("DATA_GOV_IN_LOG_LEVEL", "INFO"),
-            max_retries=int(os.getenv("DATA_GOV_IN_MAX_RETRIES", "3")),
-            retry_delay=float(os.getenv("DATA_GOV_IN_RETRY_DELAY", "1.0")),
-            backoff_factor=float(os.getenv("DATA_GOV_IN_BACKOFF_FACTOR", "2.0")),
-            default_limit=int(os.getenv("DATA_GOV_IN_DEFAULT_LIMIT", "10")),
-            max_limit=int(os.getenv("DATA_GOV_IN_MAX_LIMIT", "100")),
-        )
+        """
+        Create configuration from environment variables
+
+        Parsing is memoized on the values of the ``DATA_GOV_IN_*`` variables,
+        so repeated calls with an unchanged environment return the same
+        (immutable) instance.
+        """
+        environ = os.environ
+        snapshot = tuple(environ.get(name) for name, _, _ in _ENV_SCHEMA)
+        return _from_env_cached(snapshot)
+
+    def __post_init__(self) -> None:
+        self.validate()
 
     def validate(self) -> None:
         """Validate configuration settings"""
@@ -65,11 +110,31 @@ class Config:
             raise ValueError("timeout must be positive")
         if self.rate_limit_calls <= 0:
             raise ValueError("rate_limit_calls must be positive")
+        if self.pool_max_keepalive is not None and self.pool_max_keepalive < 0:
+            raise ValueError("pool_max_keepalive must be non-negative")
+        if self.pool_max_connections is not None and self.pool_max_connections <= 0:
+            raise ValueError("pool_max_connections must be positive")
+        if self.streaming_threshold_bytes < 0:
+            raise ValueError("streaming_threshold_bytes must be non-negative")
         if self.rate_limit_period <= 0:
             raise ValueError("rate_limit_period must be positive")
         if self.cache_ttl < 0:
             raise ValueError("cache_ttl must be non-negative")
+        if self.negative_cache_ttl < 0:
+            raise ValueError("negative_cache_ttl must be non-negative")
+        if self.cache_backend not in ("memory", "redis"):
+            raise ValueError("cache_backend must be 'memory' or 'redis'")
         if self.max_retries < 0:
             raise ValueError("max_retries must be non-negative")
         if self.default_limit <= 0 or self.default_limit > self.max_limit:
             raise ValueError(f"default_limit must be between 1 and {self.max_limit}")
+
+
+@functools.lru_cache(maxsize=4)
+def _from_env_cached(snapshot: Tuple[Optional[str], ...]) -> Config:
+    """Parse a snapshot of the environment (one value per _ENV_SCHEMA row) into a Config"""
+    return Config(**{
+        attr: convert(value)
+        for (_, attr, convert), value in zip(_ENV_SCHEMA, snapshot, strict=True)
+        if value is not None
+    })
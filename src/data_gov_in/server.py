@@ -2,14 +2,18 @@
 MCP Server implementation for data.gov.in
 """
 
+import asyncio
+import functools
 import logging
 import json
+import threading
 from typing import Optional, Dict, Any
+import orjson
 from mcp.server.fastmcp import FastMCP
 
-from .api_client import DataGovInClient
+from .api_client import DataGovInAsyncClient
 from .config import Config
-from .exceptions import DataGovInException
+from .exceptions import DataGovInException, InvalidParameterError
 
 
 # Configure logging
@@ -26,22 +30,54 @@ mcp = FastMCP(
     version="1.0.0"
 )
 
+# Upper bound on pages fetched by a single get_dataset_pages call, to cap
+# the number of concurrent requests in flight
+MAX_PAGES_PER_REQUEST = 50
+
+# Tool results at least this large (compact JSON) are returned without indentation
+PRETTY_PRINT_MAX_BYTES = 16 * 1024
+
 # Global client instance
-_client: Optional[DataGovInClient] = None
+_client: Optional[DataGovInAsyncClient] = None
+_client_lock = threading.Lock()
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a tool result to JSON using orjson
+
+    Results are indented for readability unless the compact encoding is
+    PRETTY_PRINT_MAX_BYTES or larger, where indentation would mostly add
+    whitespace to the transport.
+    """
+    compact = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    if len(compact) < PRETTY_PRINT_MAX_BYTES:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return compact.decode()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Config:
+    """Load configuration from the environment once"""
+    return Config.from_env()
 
 
-def get_client() -> DataGovInClient:
+def get_client() -> DataGovInAsyncClient:
     """Get or create the API client instance"""
     global _client
-    if _client is None:
-        config = Config.from_env()
-        _client = DataGovInClient(config)
-        logger.info("Initialized data.gov.in API client")
+    # Fast path: no lock once the client exists
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            _client = DataGovInAsyncClient(_load_config())
+            logger.info("Initialized data.gov.in API client")
     return _client
 
 
 @mcp.tool()
-def get_dataset(
+async def get_dataset(
     resource_id: str,
     limit: int = 10,
     offset: int = 0,
@@ -76,7 +112,7 @@ def get_dataset(
                     "example": '{"field_name": "value"}'
                 })
 
-        data = client.get_resource(
+        data = await client.get_resource(
             resource_id=resource_id,
             filters=filter_dict,
             offset=offset,
@@ -93,7 +129,7 @@ def get_dataset(
             "fields": data.get("field", []),
         }
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
 
     except DataGovInException as e:
         logger.error(f"Error retrieving dataset {resource_id}: {e}")
@@ -104,7 +140,7 @@ def get_dataset(
 
 
 @mcp.tool()
-def get_dataset_fields(resource_id: str) -> str:
+async def get_dataset_fields(resource_id: str) -> str:
     """
     Get field information and schema for a dataset
 
@@ -119,7 +155,7 @@ def get_dataset_fields(resource_id: str) -> str:
     """
     try:
         client = get_client()
-        fields = client.get_resource_fields(resource_id)
+        fields = await client.get_resource_fields(resource_id)
 
         result = {
             "resource_id": resource_id,
@@ -127,7 +163,7 @@ def get_dataset_fields(resource_id: str) -> str:
             "fields": fields
         }
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
 
     except DataGovInException as e:
         logger.error(f"Error retrieving fields for {resource_id}: {e}")
@@ -138,7 +174,7 @@ def get_dataset_fields(resource_id: str) -> str:
 
 
 @mcp.tool()
-def paginate_dataset(
+async def paginate_dataset(
     resource_id: str,
     page: int = 1,
     page_size: int = 10
@@ -164,7 +200,7 @@ def paginate_dataset(
         client = get_client()
         offset = (page - 1) * page_size
 
-        data = client.get_resource(
+        data = await client.get_resource(
             resource_id=resource_id,
             offset=offset,
             limit=page_size
@@ -186,7 +222,7 @@ def paginate_dataset(
             "records": data.get("records", [])
         }
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
 
     except DataGovInException as e:
         logger.error(f"Error paginating dataset {resource_id}: {e}")
@@ -197,7 +233,107 @@ def paginate_dataset(
 
 
 @mcp.tool()
-def get_dataset_summary(resource_id: str) -> str:
+async def get_dataset_pages(
+    resource_id: str,
+    start_page: int = 1,
+    end_page: int = 1,
+    page_size: int = 100
+) -> str:
+    """
+    Retrieve a range of pages from a dataset in a single call
+
+    Pages are fetched concurrently and their records merged in page order.
+
+    Args:
+        resource_id: The unique identifier for the dataset resource
+        start_page: First page to retrieve (starting from 1)
+        end_page: Last page to retrieve, inclusive (at most 50 pages per call)
+        page_size: Number of records per page (default: 100, max: 100)
+
+    Returns:
+        JSON string containing the merged records, pagination metadata and
+        any per-page errors
+
+    Example:
+        get_dataset_pages("9ef84268-d588-465a-a308-a864a43d0070", start_page=1, end_page=5)
+    """
+    try:
+        if start_page < 1:
+            return json.dumps({"error": "start_page must be >= 1"}, indent=2)
+        if end_page < start_page:
+            return json.dumps({"error": "end_page must be >= start_page"}, indent=2)
+        if end_page - start_page + 1 > MAX_PAGES_PER_REQUEST:
+            return json.dumps({
+                "error": f"Cannot fetch more than {MAX_PAGES_PER_REQUEST} pages per request"
+            }, indent=2)
+
+        client = get_client()
+        max_limit = client.config.max_limit
+        if not 1 <= page_size <= max_limit:
+            raise InvalidParameterError("page_size", f"Must be between 1 and {max_limit}")
+        pages = range(start_page, end_page + 1)
+
+        responses = await asyncio.gather(
+            *(
+                client.get_resource(
+                    resource_id=resource_id,
+                    offset=(page - 1) * page_size,
+                    limit=page_size
+                )
+                for page in pages
+            ),
+            return_exceptions=True
+        )
+
+        records = []
+        errors = []
+        total_records = None
+        for page, data in zip(pages, responses, strict=True):
+            if isinstance(data, BaseException):
+                # Parameter errors are the same for every page, report them once
+                if isinstance(data, InvalidParameterError):
+                    raise data
+                errors.append({"page": page, "error": str(data)})
+                continue
+            if total_records is None:
+                total_records = data.get("total")
+            records.extend(data.get("records", []))
+
+        if errors and not records:
+            return json.dumps({"error": errors[0]["error"], "errors": errors}, indent=2)
+
+        if total_records is None:
+            total_records = len(records)
+        total_pages = (total_records + page_size - 1) // page_size if total_records > 0 else 1
+
+        result = {
+            "resource_id": resource_id,
+            "pagination": {
+                "start_page": start_page,
+                "end_page": end_page,
+                "page_size": page_size,
+                "total_records": total_records,
+                "total_pages": total_pages,
+                "has_next": end_page < total_pages
+            },
+            "record_count": len(records),
+            "records": records,
+        }
+        if errors:
+            result["errors"] = errors
+
+        return _dumps(result)
+
+    except DataGovInException as e:
+        logger.error(f"Error fetching pages of dataset {resource_id}: {e}")
+        return json.dumps({"error": str(e)}, indent=2)
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}", exc_info=True)
+        return json.dumps({"error": f"Unexpected error: {str(e)}"}, indent=2)
+
+
+@mcp.tool()
+async def get_dataset_summary(resource_id: str) -> str:
     """
     Get a summary of a dataset including record count and field information
 
@@ -213,9 +349,9 @@ def get_dataset_summary(resource_id: str) -> str:
     try:
         client = get_client()
 
-        # Get first record to determine structure
-        data = client.get_resource(resource_id=resource_id, limit=1)
-        fields = client.get_resource_fields(resource_id)
+        # A single record carries both the total count and the field structure
+        data = await client.get_resource(resource_id=resource_id, limit=1)
+        fields = client.extract_fields(data)
 
         result = {
             "resource_id": resource_id,
@@ -225,7 +361,7 @@ def get_dataset_summary(resource_id: str) -> str:
             "sample_record": data.get("records", [None])[0] if data.get("records") else None
         }
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
 
     except DataGovInException as e:
         logger.error(f"Error getting summary for {resource_id}: {e}")
@@ -236,7 +372,7 @@ def get_dataset_summary(resource_id: str) -> str:
 
 
 @mcp.tool()
-def filter_dataset(
+async def filter_dataset(
     resource_id: str,
     field: str,
     value: str,
@@ -261,7 +397,7 @@ def filter_dataset(
         client = get_client()
         filters = {field: value}
 
-        data = client.get_resource(
+        data = await client.get_resource(
             resource_id=resource_id,
             filters=filters,
             limit=limit
@@ -274,7 +410,7 @@ def filter_dataset(
             "records": data.get("records", [])
         }
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
 
     except DataGovInException as e:
         logger.error(f"Error filtering dataset {resource_id}: {e}")
@@ -285,7 +421,7 @@ def filter_dataset(
 
 
 @mcp.tool()
-def get_cache_statistics() -> str:
+async def get_cache_statistics() -> str:
     """
     Get statistics about the API response cache
 
@@ -297,7 +433,7 @@ def get_cache_statistics() -> str:
     """
     try:
         client = get_client()
-        stats = client.get_cache_stats()
+        stats = await client.get_cache_stats()
 
         if stats is None:
             return json.dumps({
@@ -313,7 +449,7 @@ def get_cache_statistics() -> str:
 
 
 @mcp.tool()
-def clear_cache() -> str:
+async def clear_cache() -> str:
     """
     Clear all cached API responses
 
@@ -325,7 +461,7 @@ def clear_cache() -> str:
     """
     try:
         client = get_client()
-        client.clear_cache()
+        await client.clear_cache()
 
         return json.dumps({
             "success": True,
@@ -338,7 +474,7 @@ def clear_cache() -> str:
 
 
 @mcp.tool()
-def get_server_info() -> str:
+async def get_server_info() -> str:
     """
     Get information about the MCP server and its configuration
 
@@ -0,0 +1,47 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client calls RedisCache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        return [key for key in self.data if key.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FailingRedis:
+    """Redis stand-in whose every call fails as if the server were down"""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        return fail
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis client for RedisCache tests"""
+    return FakeRedis()
+
+
+@pytest.fixture
+def failing_redis():
+    """Redis client that raises on every call"""
+    return FailingRedis()
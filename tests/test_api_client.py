@@ -2,17 +2,33 @@
 Tests for API client
 """
 
+import asyncio
+import time
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import httpx
-
-from src.data_gov_in.api_client import DataGovInClient, RateLimiter
+import orjson
+import respx
+
+from src.data_gov_in.api_client import (
+    DataGovInClient,
+    DataGovInAsyncClient,
+    RateLimiter,
+    AsyncRateLimiter,
+    MAX_RETRY_DELAY,
+)
+from src.data_gov_in.cache import RedisCache
 from src.data_gov_in.config import Config
 from src.data_gov_in.exceptions import (
     APIKeyMissingError,
     ResourceNotFoundError,
     RateLimitError,
     InvalidParameterError,
+    APIError,
+    NetworkError,
 )
 
 
@@ -39,6 +55,53 @@ class TestRateLimiter:
             limiter.wait_if_needed()
             assert mock_sleep.called
 
+    def test_rate_limiter_refills_over_time(self):
+        """Test that tokens are refilled in proportion to elapsed time"""
+        limiter = RateLimiter(max_calls=2, period=1)
+
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+        limiter.last_refill -= 0.5  # pretend half the period has passed
+
+        with patch('time.sleep') as mock_sleep:
+            limiter.wait_if_needed()
+            assert not mock_sleep.called
+
+    def test_rate_limiter_queues_waiting_callers(self):
+        """Test that back-to-back waits are spaced by the refill interval"""
+        limiter = RateLimiter(max_calls=1, period=1)
+        limiter.wait_if_needed()
+
+        with patch('time.sleep') as mock_sleep:
+            limiter.wait_if_needed()
+            limiter.wait_if_needed()
+
+        first, second = (call.args[0] for call in mock_sleep.call_args_list)
+        assert first == pytest.approx(1.0, abs=0.05)
+        assert second == pytest.approx(2.0, abs=0.05)
+
+    def test_rate_limiter_burst_smaller_than_rate(self):
+        """Test that burst caps back-to-back calls independently of the rate"""
+        limiter = RateLimiter(max_calls=100, period=60, burst=1)
+
+        limiter.wait_if_needed()
+
+        with patch('time.sleep') as mock_sleep:
+            limiter.wait_if_needed()
+            assert mock_sleep.call_args.args[0] == pytest.approx(0.6, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limiter_enforces_limit(self):
+        """Test that async rate limiter awaits instead of blocking"""
+        limiter = AsyncRateLimiter(max_calls=2, period=1)
+
+        await limiter.wait_if_needed()
+        await limiter.wait_if_needed()
+
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await limiter.wait_if_needed()
+            assert mock_sleep.await_count == 1
+
 
 class TestDataGovInClient:
     """Test DataGovInClient"""
@@ -55,6 +118,24 @@ class TestDataGovInClient:
         client = DataGovInClient(config)
         assert client.config.api_key == "test-key"
 
+    def test_pool_limits_derived_from_rate_limit(self):
+        """Test that pool sizes follow the rate limit, within caps"""
+        client = DataGovInClient(Config(api_key="test-key", rate_limit_calls=10))
+        assert client._limits.max_keepalive_connections == 10
+        assert client._limits.max_connections == 20
+
+        client = DataGovInClient(Config(api_key="test-key", rate_limit_calls=1000))
+        assert client._limits.max_keepalive_connections == 64
+        assert client._limits.max_connections == 128
+
+    def test_pool_limits_explicit(self):
+        """Test that explicit pool sizes override the derived values"""
+        config = Config(api_key="test-key", pool_max_keepalive=3, pool_max_connections=7)
+        client = DataGovInClient(config)
+
+        assert client._limits.max_keepalive_connections == 3
+        assert client._limits.max_connections == 7
+
     def test_missing_api_key_raises_error(self):
         """Test that missing API key raises error on request"""
         config = Config(api_key=None)
@@ -71,16 +152,16 @@ class TestDataGovInClient:
         with pytest.raises(InvalidParameterError):
             client.get_resource("test-resource", limit=200)
 
+        with pytest.raises(InvalidParameterError, match="between 1 and 100"):
+            client.get_resource("test-resource", limit=-5)
+
     @patch('httpx.Client.get')
     def test_successful_request(self, mock_get):
         """Test successful API request"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "records": [{"id": 1, "name": "test"}],
-            "total": 1
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(
+            status_code=200,
+            content=orjson.dumps({"records": [{"id": 1, "name": "test"}], "total": 1})
+        )
 
         config = Config(api_key="test-key", cache_enabled=False)
         client = DataGovInClient(config)
@@ -91,12 +172,43 @@ class TestDataGovInClient:
         assert len(result["records"]) == 1
         mock_get.assert_called_once()
 
+    @respx.mock
+    def test_request_does_not_mutate_params(self):
+        """Test that authentication params are added without touching the caller's dict"""
+        route = respx.get("https://api.data.gov.in/resource/test-resource").mock(
+            return_value=httpx.Response(200, json={"records": []})
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False)
+        client = DataGovInClient(config)
+        params = {"limit": 1}
+
+        client._make_request("test-resource", params)
+
+        assert params == {"limit": 1}
+        sent = dict(route.calls.last.request.url.params)
+        assert sent == {"api-key": "test-key", "format": "json", "limit": "1"}
+
+    @respx.mock
+    def test_requests_use_base_url(self):
+        """Test that requests are routed through the pooled client's base_url"""
+        route = respx.get("https://example.test/api/resource/test-resource").mock(
+            return_value=httpx.Response(200, json={"records": []})
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False, base_url="https://example.test/api")
+        client = DataGovInClient(config)
+
+        client.get_resource("test-resource")
+        client.get_resource("test-resource", offset=10)
+
+        assert route.call_count == 2
+        assert route.calls.last.request.url.params["offset"] == "10"
+
     @patch('httpx.Client.get')
     def test_404_error_raises_resource_not_found(self, mock_get):
         """Test that 404 raises ResourceNotFoundError"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(status_code=404, content=b"")
 
         config = Config(api_key="test-key", cache_enabled=False)
         client = DataGovInClient(config)
@@ -104,12 +216,42 @@ class TestDataGovInClient:
         with pytest.raises(ResourceNotFoundError):
             client.get_resource("non-existent")
 
+    @respx.mock
+    def test_404_error_is_negatively_cached(self):
+        """Test that repeated lookups of a missing resource skip the API"""
+        route = respx.get("https://api.data.gov.in/resource/non-existent").mock(
+            return_value=httpx.Response(404)
+        )
+
+        config = Config(api_key="test-key", cache_enabled=True, negative_cache_ttl=30)
+        client = DataGovInClient(config)
+
+        for _ in range(2):
+            with pytest.raises(ResourceNotFoundError):
+                client.get_resource("non-existent")
+
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_negative_cache_disabled(self):
+        """Test that negative_cache_ttl=0 retries failed lookups"""
+        route = respx.get("https://api.data.gov.in/resource/non-existent").mock(
+            return_value=httpx.Response(404)
+        )
+
+        config = Config(api_key="test-key", cache_enabled=True, negative_cache_ttl=0)
+        client = DataGovInClient(config)
+
+        for _ in range(2):
+            with pytest.raises(ResourceNotFoundError):
+                client.get_resource("non-existent")
+
+        assert route.call_count == 2
+
     @patch('httpx.Client.get')
     def test_429_error_raises_rate_limit(self, mock_get):
         """Test that 429 raises RateLimitError"""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(status_code=429, content=b"")
 
         config = Config(api_key="test-key", cache_enabled=False)
         client = DataGovInClient(config)
@@ -120,10 +262,9 @@ class TestDataGovInClient:
     @patch('httpx.Client.get')
     def test_caching_works(self, mock_get):
         """Test that caching works correctly"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"records": [], "total": 0}
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(
+            status_code=200, content=orjson.dumps({"records": [], "total": 0})
+        )
 
         config = Config(api_key="test-key", cache_enabled=True, cache_ttl=3600)
         client = DataGovInClient(config)
@@ -144,7 +285,7 @@ class TestDataGovInClient:
         # First call fails, second succeeds
         mock_get.side_effect = [
             httpx.TimeoutException("Timeout"),
-            Mock(status_code=200, json=lambda: {"records": [], "total": 0})
+            Mock(status_code=200, content=b'{"records": [], "total": 0}')
         ]
 
         config = Config(api_key="test-key", cache_enabled=False, max_retries=2, retry_delay=0.1)
@@ -155,6 +296,114 @@ class TestDataGovInClient:
         assert result is not None
         assert mock_get.call_count == 2
 
+    @respx.mock
+    def test_streaming_large_response(self):
+        """Test that bodies above the streaming threshold are parsed incrementally"""
+        pytest.importorskip("ijson")
+        body = orjson.dumps({"records": [{"id": i} for i in range(50)], "total": 50})
+        respx.get("https://api.data.gov.in/resource/test-resource").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False, streaming_threshold_bytes=64)
+        client = DataGovInClient(config)
+
+        with patch('src.data_gov_in.api_client.orjson.loads') as mock_loads:
+            result = client.get_resource("test-resource", limit=50)
+
+        assert not mock_loads.called
+        assert result["total"] == 50
+        assert result["records"][49] == {"id": 49}
+
+    @respx.mock
+    def test_streaming_error_response(self):
+        """Test that streamed error responses still map to exceptions"""
+        respx.get("https://api.data.gov.in/resource/non-existent").mock(
+            return_value=httpx.Response(404)
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False, streaming_threshold_bytes=64)
+        client = DataGovInClient(config)
+
+        with pytest.raises(ResourceNotFoundError):
+            client.get_resource("non-existent")
+
+    @respx.mock
+    def test_server_error_is_not_retried(self):
+        """Test that HTTP error statuses fail fast without retries"""
+        route = respx.get("https://api.data.gov.in/resource/test-resource").mock(
+            return_value=httpx.Response(503, text="Unavailable")
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False, max_retries=2, retry_delay=0.1)
+        client = DataGovInClient(config)
+
+        with pytest.raises(APIError):
+            client.get_resource("test-resource")
+        assert route.call_count == 1
+
+    @respx.mock
+    @patch('time.sleep')
+    def test_malformed_json_is_retried(self, mock_sleep):
+        """Test that bodies orjson cannot decode are retried, then surface as APIError"""
+        route = respx.get("https://api.data.gov.in/resource/test-resource").mock(
+            return_value=httpx.Response(200, content=b"<html>not json</html>")
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False, max_retries=1)
+        client = DataGovInClient(config)
+
+        with pytest.raises(APIError, match="Invalid JSON response"):
+            client.get_resource("test-resource")
+        assert route.call_count == 2
+
+    @patch('src.data_gov_in.api_client.random.uniform', side_effect=lambda low, high: high)
+    @patch('time.sleep')
+    @patch('httpx.Client.get')
+    def test_retry_backoff_schedule(self, mock_get, mock_sleep, mock_uniform):
+        """Test that retries use full jitter over the exponential backoff"""
+        mock_get.side_effect = httpx.ConnectError("Connection refused")
+
+        config = Config(
+            api_key="test-key", cache_enabled=False,
+            max_retries=3, retry_delay=0.5, backoff_factor=2.0
+        )
+        client = DataGovInClient(config)
+
+        with pytest.raises(NetworkError):
+            client.get_resource("test-resource")
+
+        assert mock_get.call_count == 4
+        assert [call.args for call in mock_uniform.call_args_list] == [(0, 0.5), (0, 1.0), (0, 2.0)]
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0, 2.0]
+
+    def test_retry_backoff_is_capped(self):
+        """Test that no single backoff exceeds MAX_RETRY_DELAY"""
+        config = Config(
+            api_key="test-key", cache_enabled=False,
+            max_retries=3, retry_delay=20.0, backoff_factor=2.0
+        )
+        client = DataGovInClient(config)
+
+        assert client._retry_delays == [20.0, MAX_RETRY_DELAY, MAX_RETRY_DELAY]
+
+    def test_concurrent_requests_are_coalesced(self):
+        """Test that simultaneous identical requests share one HTTP call"""
+        def slow_get(*args, **kwargs):
+            time.sleep(0.1)
+            return Mock(status_code=200, content=b'{"records": [], "total": 0}')
+
+        config = Config(api_key="test-key", cache_enabled=True)
+        client = DataGovInClient(config)
+
+        with patch('httpx.Client.get', side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: client.get_resource("test-resource"), range(4)))
+
+        assert mock_get.call_count == 1
+        assert all(result == {"records": [], "total": 0} for result in results)
+        assert client._inflight == {}
+
     def test_get_resource_fields(self):
         """Test getting resource fields"""
         config = Config(api_key="test-key", cache_enabled=False)
@@ -174,6 +423,42 @@ class TestDataGovInClient:
             assert len(fields) == 2
             assert fields[0]["id"] == "name"
 
+    def test_extract_fields_infers_from_record(self):
+        """Test that fields are inferred from the first record when not provided"""
+        data = {"records": [{"name": "test", "value": 1}]}
+
+        fields = DataGovInClient.extract_fields(data)
+
+        assert fields == [{"id": "name", "type": "str"}, {"id": "value", "type": "int"}]
+        assert DataGovInClient.extract_fields({"records": []}) == []
+
+    def test_extract_fields_uses_dominant_type(self):
+        """Test that nulls and outliers don't decide a field's inferred type"""
+        data = {"records": [
+            {"name": None, "value": 1, "empty": None},
+            {"name": "b", "value": 2.5, "empty": None},
+            {"name": "c", "value": 3, "empty": None},
+        ]}
+
+        fields = DataGovInClient.extract_fields(data)
+
+        assert fields == [
+            {"id": "name", "type": "str"},
+            {"id": "value", "type": "int"},
+            {"id": "empty", "type": "NoneType"},
+        ]
+
+    @patch('httpx.Client.get')
+    def test_get_resource_fields_samples_records(self, mock_get):
+        """Test that field inference requests a multi-record sample"""
+        mock_get.return_value = Mock(status_code=200, content=b'{"records": [{"a": 1}]}')
+
+        config = Config(api_key="test-key", cache_enabled=False)
+        client = DataGovInClient(config)
+        client.get_resource_fields("test-resource")
+
+        assert mock_get.call_args.kwargs["params"]["limit"] == 20
+
     def test_context_manager(self):
         """Test client as context manager"""
         config = Config(api_key="test-key")
@@ -183,3 +468,203 @@ class TestDataGovInClient:
 
         # Client should be closed after context
         assert client.client.is_closed
+
+
+class TestDataGovInAsyncClient:
+    """Test DataGovInAsyncClient"""
+
+    def test_cache_is_unlocked(self):
+        """Test that the single-loop async client uses a lock-free cache"""
+        client = DataGovInAsyncClient(Config(api_key="test-key", cache_enabled=True))
+        assert len(client.cache._shards) == 1
+        assert not hasattr(client.cache._shards[0].lock, "acquire")
+
+        sync_client = DataGovInClient(Config(api_key="test-key", cache_enabled=True))
+        assert hasattr(sync_client.cache._shards[0].lock, "acquire")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_redis_cache_calls_run_off_the_event_loop(self, fake_redis):
+        """Test that blocking Redis cache calls are sent to a worker thread"""
+        respx.get("https://api.data.gov.in/resource/test-resource").mock(
+            return_value=httpx.Response(200, json={"records": [], "total": 0})
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False)
+        async with DataGovInAsyncClient(config) as client:
+            client.cache = RedisCache(default_ttl=60, client=fake_redis)
+            with patch('asyncio.to_thread', wraps=asyncio.to_thread) as mock_to_thread:
+                await client.get_resource("test-resource")
+                result = await client.get_resource("test-resource")
+                stats = await client.get_cache_stats()
+
+        assert result == {"records": [], "total": 0}
+        # miss lookup, store, hit lookup, stats
+        assert mock_to_thread.await_count == 4
+        assert stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_api_key_raises_error(self):
+        """Test that missing API key raises error on request"""
+        config = Config(api_key=None)
+
+        async with DataGovInAsyncClient(config) as client:
+            with pytest.raises(APIKeyMissingError):
+                await client.get_resource("test-resource")
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_successful_request(self, mock_get):
+        """Test successful API request"""
+        mock_get.return_value = SimpleNamespace(
+            status_code=200,
+            content=orjson.dumps({"records": [{"id": 1, "name": "test"}], "total": 1})
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False)
+        async with DataGovInAsyncClient(config) as client:
+            result = await client.get_resource("test-resource", limit=10)
+
+        assert len(result["records"]) == 1
+        mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_404_error_raises_resource_not_found(self, mock_get):
+        """Test that 404 raises ResourceNotFoundError"""
+        mock_get.return_value = SimpleNamespace(status_code=404, content=b"")
+
+        config = Config(api_key="test-key", cache_enabled=False)
+        async with DataGovInAsyncClient(config) as client:
+            with pytest.raises(ResourceNotFoundError):
+                await client.get_resource("non-existent")
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_caching_works(self, mock_get):
+        """Test that caching works correctly"""
+        mock_get.return_value = SimpleNamespace(
+            status_code=200, content=b'{"records": [], "total": 0}'
+        )
+
+        config = Config(api_key="test-key", cache_enabled=True, cache_ttl=3600)
+        async with DataGovInAsyncClient(config) as client:
+            await client.get_resource("test-resource", limit=10)
+            result = await client.get_resource("test-resource", limit=10)
+
+        assert mock_get.await_count == 1
+        assert result is not None
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_retry_logic(self, mock_get):
+        """Test retry logic on network errors"""
+        mock_get.side_effect = [
+            httpx.TimeoutException("Timeout"),
+            Mock(status_code=200, content=b'{"records": [], "total": 0}')
+        ]
+
+        config = Config(api_key="test-key", cache_enabled=False, max_retries=2, retry_delay=0.1)
+        async with DataGovInAsyncClient(config) as client:
+            result = await client.get_resource("test-resource")
+
+        assert result is not None
+        assert mock_get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Test that simultaneous identical requests share one HTTP call"""
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return Mock(status_code=200, content=b'{"records": [], "total": 0}')
+
+        config = Config(api_key="test-key", cache_enabled=True)
+        async with DataGovInAsyncClient(config) as client:
+            with patch('httpx.AsyncClient.get', side_effect=slow_get) as mock_get:
+                results = await asyncio.gather(
+                    *(client.get_resource("test-resource") for _ in range(4))
+                )
+
+        assert mock_get.call_count == 1
+        assert all(result == {"records": [], "total": 0} for result in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_many_preserves_order(self):
+        """Test that get_many fetches resources concurrently and keeps their order"""
+        resource_route = respx.get(url__regex=r"https://api\.data\.gov\.in/resource/(?P<resource_id>[\w-]+)")
+        resource_route.side_effect = lambda request, resource_id: httpx.Response(
+            200, json={"records": [{"id": resource_id}], "total": 1}
+        )
+
+        config = Config(api_key="test-key", cache_enabled=False)
+        async with DataGovInAsyncClient(config) as client:
+            results = await client.get_many(["a", "b", "c"], limit=5)
+
+        assert [result["records"][0]["id"] for result in results] == ["a", "b", "c"]
+        assert resource_route.call_count == 3
+        assert all(call.request.url.params["limit"] == "5" for call in resource_route.calls)
+
+    @pytest.mark.asyncio
+    async def test_get_many_validates_before_requesting(self):
+        """Test that an invalid limit fails before any request is sent"""
+        config = Config(api_key="test-key", max_limit=100)
+        async with DataGovInAsyncClient(config) as client:
+            with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+                with pytest.raises(InvalidParameterError):
+                    await client.get_many(["a", "b"], limit=200)
+
+        assert mock_get.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that cancelling the first caller leaves the shared request running"""
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return SimpleNamespace(status_code=200, content=b'{"records": [], "total": 0}')
+
+        config = Config(api_key="test-key", cache_enabled=True)
+        async with DataGovInAsyncClient(config) as client:
+            with patch('httpx.AsyncClient.get', side_effect=slow_get) as mock_get:
+                leader = asyncio.ensure_future(client.get_resource("test-resource"))
+                await asyncio.sleep(0)
+                follower = asyncio.ensure_future(client.get_resource("test-resource"))
+                await asyncio.sleep(0)
+
+                leader.cancel()
+                result = await follower
+
+        assert leader.cancelled()
+        assert result == {"records": [], "total": 0}
+        assert mock_get.call_count == 1
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_coalesced_requests_share_errors(self, mock_get):
+        """Test that waiters receive the leader's error"""
+        async def failing_get(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return Mock(status_code=404)
+        mock_get.side_effect = failing_get
+
+        config = Config(api_key="test-key", cache_enabled=True, negative_cache_ttl=0)
+        async with DataGovInAsyncClient(config) as client:
+            results = await asyncio.gather(
+                *(client.get_resource("missing") for _ in range(3)),
+                return_exceptions=True
+            )
+
+        assert mock_get.await_count == 1
+        assert all(isinstance(result, ResourceNotFoundError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self):
+        """Test client as async context manager"""
+        config = Config(api_key="test-key")
+
+        async with DataGovInAsyncClient(config) as client:
+            assert client is not None
+
+        assert client.client.is_closed
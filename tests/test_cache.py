@@ -4,7 +4,7 @@ Tests for cache module
 
 import time
 import pytest
-from src.data_gov_in.cache import Cache, CacheEntry
+from src.data_gov_in.cache import Cache, CacheEntry, ErrorMarker, RedisCache
 
 
 class TestCacheEntry:
@@ -22,6 +22,13 @@ class TestCacheEntry:
         time.sleep(0.1)
         assert entry.is_expired()
 
+    def test_cache_entry_slots(self):
+        """Test that cache entries carry no per-instance __dict__"""
+        entry = CacheEntry("test_value", ttl=10)
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = 1
+
 
 class TestCache:
     """Test Cache functionality"""
@@ -66,6 +73,48 @@ class TestCache:
         assert cache.get("key3") == "value3"
         assert cache.get("key4") == "value4"
 
+    def test_cache_evicts_expired_before_lru(self):
+        """Test that a full cache drops expired entries before live LRU victims"""
+        cache = Cache(max_size=3, default_ttl=60)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2", ttl=0)
+        cache.set("key3", "value3")
+        time.sleep(0.01)
+
+        cache.set("key4", "value4")  # Should evict expired key2, not key1
+
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+        assert cache.get("key4") == "value4"
+        assert len(cache) == 3
+
+    def test_cache_miss_drains_expired_entries(self):
+        """Test that a miss removes a bounded batch of expired entries"""
+        cache = Cache(max_size=30, default_ttl=60)
+        drain = cache._shards[0].DRAIN_ON_MISS
+
+        for i in range(drain + 4):
+            cache.set(f"dead{i}", i, ttl=0)
+        cache.set("live", "value")
+        time.sleep(0.01)
+
+        assert cache.get("missing") is None
+        assert len(cache) == 5
+        assert cache.get("missing") is None
+        assert len(cache) == 1
+        assert cache.get("live") == "value"
+
+    def test_cache_expiry_heap_stays_bounded(self):
+        """Test that stale heap items from repeated updates are compacted"""
+        cache = Cache(max_size=2, default_ttl=60)
+
+        for i in range(50):
+            cache.set("key1", i)
+
+        assert len(cache._shards[0].expiry_heap) <= 4
+        assert cache.get("key1") == 49
+
     def test_cache_lru_ordering(self):
         """Test LRU ordering is maintained"""
         cache = Cache(max_size=3, default_ttl=60)
@@ -96,7 +145,7 @@ class TestCache:
 
         assert cache.get("key1") is None
         assert cache.get("key2") is None
-        assert len(cache._cache) == 0
+        assert len(cache) == 0
 
     def test_cache_stats(self):
         """Test cache statistics"""
@@ -129,6 +178,55 @@ class TestCache:
         # Different arguments should produce different key
         assert key1 != key3
 
+    def test_cache_make_key_nested_values(self):
+        """Test that dict-valued kwargs produce order-independent, usable keys"""
+        cache = Cache(max_size=10, default_ttl=60)
+
+        key1 = cache._make_key("res", filters={"state": "MH", "year": "2020"})
+        key2 = cache._make_key("res", filters={"year": "2020", "state": "MH"})
+
+        assert key1 == key2
+        cache.set(key1, "value")
+        assert cache.get(key2) == "value"
+
+    def test_cache_make_key_kwarg_order(self):
+        """Test that keyword order does not change plain or hashed keys"""
+        cache = Cache(max_size=10, default_ttl=60)
+
+        assert (
+            cache._make_key("res", limit=10, offset=0)
+            == cache._make_key("res", offset=0, limit=10)
+        )
+        assert (
+            cache._make_key("res", hashed=True, limit=10, offset=0)
+            == cache._make_key("res", hashed=True, offset=0, limit=10)
+        )
+
+    def test_cache_make_key_hashed(self):
+        """Test that hashed keys are stable hex strings"""
+        cache = Cache(max_size=10, default_ttl=60)
+
+        key1 = cache._make_key("res", hashed=True, limit=10)
+        key2 = cache._make_key("res", hashed=True, limit=10)
+
+        key3 = cache._make_key("res", hashed=True, limit=20)
+
+        assert isinstance(key1, str)
+        assert len(key1) == 32
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_cache_get_by_params(self):
+        """Test combined key computation and lookup"""
+        cache = Cache(max_size=10, default_ttl=60)
+
+        key, value = cache.get_by_params("res", limit=10)
+        assert value is None
+        assert key == cache._make_key("res", limit=10)
+
+        cache.set(key, "value")
+        assert cache.get_by_params("res", limit=10) == (key, "value")
+
     def test_cache_update_existing_key(self):
         """Test updating existing key"""
         cache = Cache(max_size=10, default_ttl=60)
@@ -138,7 +236,28 @@ class TestCache:
 
         result = cache.get("key1")
         assert result == "value2"
-        assert len(cache._cache) == 1
+        assert len(cache) == 1
+
+    def test_cache_update_refreshes_recency(self):
+        """Test that updating a key makes it most recently used"""
+        cache = Cache(max_size=2, default_ttl=60)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key1", "value1b")
+        cache.set("key3", "value3")  # Should evict key2
+
+        assert cache.get("key1") == "value1b"
+        assert cache.get("key2") is None
+
+    def test_cache_zero_size_stores_nothing(self):
+        """Test that a zero-size cache accepts writes without error"""
+        cache = Cache(max_size=0, default_ttl=60)
+
+        cache.set("key1", "value1")
+
+        assert cache.get("key1") is None
+        assert len(cache) == 0
 
     def test_cache_custom_ttl(self):
         """Test custom TTL for individual entries"""
@@ -148,3 +267,102 @@ class TestCache:
         time.sleep(0.1)
 
         assert cache.get("key1") is None
+
+    def test_cache_error_marker_reraises(self):
+        """Test that cached errors are raised again on lookup"""
+        cache = Cache(max_size=10, default_ttl=60)
+
+        cache.set("key1", ErrorMarker(ValueError("bad")), ttl=30)
+
+        with pytest.raises(ValueError, match="bad"):
+            cache.get("key1")
+        assert cache.stats()["hits"] == 1
+
+    def test_cache_sharding(self):
+        """Test that large caches are sharded without losing capacity"""
+        cache = Cache(max_size=1000, default_ttl=60, shards=16)
+
+        assert len(cache._shards) == 16
+        assert sum(shard.max_size for shard in cache._shards) == 1000
+
+        for i in range(100):
+            cache.set(f"key{i}", i)
+
+        assert len(cache) == 100
+        assert all(cache.get(f"key{i}") == i for i in range(100))
+        assert cache.stats()["hits"] == 100
+
+    def test_small_cache_uses_single_shard(self):
+        """Test that small caches keep exact LRU with a single shard"""
+        cache = Cache(max_size=3, default_ttl=60, shards=16)
+        assert len(cache._shards) == 1
+
+    def test_cache_without_thread_safety(self):
+        """Test that thread_safe=False skips locking and sharding"""
+        cache = Cache(max_size=1000, default_ttl=60, thread_safe=False)
+
+        assert len(cache._shards) == 1
+        assert not hasattr(cache._shards[0].lock, "acquire")
+
+        cache.set("key1", "value1")
+        assert cache.get("key1") == "value1"
+        assert cache.stats()["hits"] == 1
+
+
+class TestRedisCache:
+    """Test RedisCache functionality"""
+
+    def test_set_and_get_round_trip(self, fake_redis):
+        """Test values survive orjson serialization through Redis"""
+        cache = RedisCache(default_ttl=60, client=fake_redis)
+
+        key, value = cache.get_by_params("res", limit=10)
+        assert value is None
+        cache.set(key, {"records": [{"id": 1}], "total": 1})
+
+        assert cache.get(key) == {"records": [{"id": 1}], "total": 1}
+        assert key.startswith("data-gov-in:")
+        stats = cache.stats()
+        assert stats["backend"] == "redis"
+        assert stats["size"] is None
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_error_markers_not_stored(self, fake_redis):
+        """Test that negative cache entries stay out of Redis"""
+        cache = RedisCache(default_ttl=60, client=fake_redis)
+
+        cache.set("data-gov-in:key", ErrorMarker(ValueError("bad")))
+
+        assert fake_redis.data == {}
+
+    def test_clear_only_removes_prefixed_keys(self, fake_redis):
+        """Test that clear leaves other applications' keys alone"""
+        fake_redis.data["other:key"] = b"1"
+        cache = RedisCache(default_ttl=60, client=fake_redis)
+        cache.set(cache._make_key("res"), {"records": []})
+
+        cache.clear()
+
+        assert fake_redis.data == {"other:key": b"1"}
+
+    def test_outage_does_not_raise(self, failing_redis):
+        """Test that Redis failures degrade to misses and no-op clears"""
+        cache = RedisCache(default_ttl=60, client=failing_redis)
+
+        key, value = cache.get_by_params("res", limit=10)
+        assert value is None
+        cache.set(key, {"records": []})
+
+        assert cache.stats()["misses"] == 1
+
+        cache.clear()
+
+    def test_undecodable_value_is_a_miss(self, fake_redis):
+        """Test that a corrupt stored value is treated as a cache miss"""
+        cache = RedisCache(default_ttl=60, client=fake_redis)
+        key = cache._make_key("res")
+        fake_redis.data[key] = b"{not json"
+
+        assert cache.get(key) is None
+        assert cache.stats()["misses"] == 1
@@ -18,6 +18,8 @@ class TestConfig:
         assert config.timeout == 30
         assert config.cache_enabled is True
         assert config.default_limit == 10
+        assert config.http2 is True
+        assert config.pool_max_keepalive is None
 
     def test_custom_config(self):
         """Test custom configuration values"""
@@ -45,6 +47,34 @@ class TestConfig:
         assert config.cache_enabled is False
         assert config.max_limit == 200
 
+    def test_config_pool_from_env(self, monkeypatch):
+        """Test loading connection pool settings from environment variables"""
+        monkeypatch.setenv("DATA_GOV_IN_HTTP2", "false")
+        monkeypatch.setenv("DATA_GOV_IN_POOL_MAX_KEEPALIVE", "5")
+        monkeypatch.setenv("DATA_GOV_IN_POOL_MAX_CONNECTIONS", "10")
+
+        config = Config.from_env()
+
+        assert config.http2 is False
+        assert config.pool_max_keepalive == 5
+        assert config.pool_max_connections == 10
+
+    def test_config_from_env_memoized(self, monkeypatch):
+        """Test that unchanged environments reuse the parsed config"""
+        from src.data_gov_in.config import _from_env_cached
+
+        monkeypatch.setenv("DATA_GOV_IN_TIMEOUT", "45")
+        _from_env_cached.cache_clear()
+
+        first = Config.from_env()
+        second = Config.from_env()
+        assert _from_env_cached.cache_info().hits == 1
+        assert first is second
+
+        monkeypatch.setenv("DATA_GOV_IN_TIMEOUT", "50")
+        assert Config.from_env().timeout == 50
+        assert _from_env_cached.cache_info().misses == 2
+
     def test_config_validation_valid(self):
         """Test validation of valid configuration"""
         config = Config(
@@ -58,42 +88,42 @@ class TestConfig:
         # Should not raise
         config.validate()
 
+    def test_config_is_frozen(self):
+        """Test that configuration cannot be mutated after construction"""
+        config = Config()
+
+        with pytest.raises(AttributeError):
+            config.timeout = 60
+
     def test_config_validation_invalid_timeout(self):
         """Test validation fails for invalid timeout"""
-        config = Config(timeout=0)
-
         with pytest.raises(ValueError, match="timeout must be positive"):
-            config.validate()
+            Config(timeout=0)
 
     def test_config_validation_invalid_rate_limit(self):
         """Test validation fails for invalid rate limit"""
-        config = Config(rate_limit_calls=0)
-
         with pytest.raises(ValueError, match="rate_limit_calls must be positive"):
-            config.validate()
+            Config(rate_limit_calls=0)
 
     def test_config_validation_invalid_default_limit(self):
         """Test validation fails for invalid default limit"""
-        config = Config(default_limit=0)
-
         with pytest.raises(ValueError, match="default_limit must be between"):
-            config.validate()
-
-        config = Config(default_limit=200, max_limit=100)
+            Config(default_limit=0)
 
         with pytest.raises(ValueError, match="default_limit must be between"):
-            config.validate()
+            Config(default_limit=200, max_limit=100)
 
     def test_config_validation_negative_cache_ttl(self):
         """Test validation fails for negative cache TTL"""
-        config = Config(cache_ttl=-1)
-
         with pytest.raises(ValueError, match="cache_ttl must be non-negative"):
-            config.validate()
+            Config(cache_ttl=-1)
+
+    def test_config_validation_invalid_cache_backend(self):
+        """Test validation fails for unknown cache backend"""
+        with pytest.raises(ValueError, match="cache_backend must be"):
+            Config(cache_backend="memcached")
 
     def test_config_validation_negative_retries(self):
         """Test validation fails for negative max retries"""
-        config = Config(max_retries=-1)
-
         with pytest.raises(ValueError, match="max_retries must be non-negative"):
-            config.validate()
+            Config(max_retries=-1)
@@ -0,0 +1,103 @@
+"""
+Tests for MCP server tools
+"""
+
+import pytest
+import orjson
+from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+
+from src.data_gov_in import server
+from src.data_gov_in.config import Config
+from src.data_gov_in.exceptions import NetworkError
+
+
+def make_client(get_resource):
+    """Stand-in for the shared async client with a given get_resource"""
+    return SimpleNamespace(
+        config=Config(api_key="test-key"),
+        get_resource=AsyncMock(side_effect=get_resource)
+    )
+
+
+async def page_of(resource_id, offset, limit):
+    """Return a page whose record ids are the absolute record offsets"""
+    return {"total": 25, "records": [{"id": offset + i} for i in range(limit)]}
+
+
+class TestGetDatasetPages:
+    """Test the get_dataset_pages tool"""
+
+    @pytest.mark.asyncio
+    async def test_records_merged_in_page_order(self):
+        """Test that records from concurrent pages are merged in page order"""
+        client = make_client(page_of)
+
+        with patch.object(server, "get_client", return_value=client):
+            result = orjson.loads(await server.get_dataset_pages("res", 1, 3, page_size=5))
+
+        assert [record["id"] for record in result["records"]] == list(range(15))
+        assert result["pagination"]["total_pages"] == 5
+        assert result["pagination"]["has_next"] is True
+        assert "errors" not in result
+        offsets = sorted(call.kwargs["offset"] for call in client.get_resource.call_args_list)
+        assert offsets == [0, 5, 10]
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_is_reported(self):
+        """Test that failed pages are listed while the rest are returned"""
+        async def flaky(resource_id, offset, limit):
+            if offset == 5:
+                raise NetworkError("Request timeout")
+            return await page_of(resource_id, offset, limit)
+
+        client = make_client(flaky)
+
+        with patch.object(server, "get_client", return_value=client):
+            result = orjson.loads(await server.get_dataset_pages("res", 1, 3, page_size=5))
+
+        ids = [record["id"] for record in result["records"]]
+        assert ids == list(range(5)) + list(range(10, 15))
+        assert result["errors"] == [{"page": 2, "error": "Request timeout"}]
+
+    @pytest.mark.asyncio
+    async def test_all_pages_failing_returns_error(self):
+        """Test that an error is returned when no page succeeds"""
+        async def failing(resource_id, offset, limit):
+            raise NetworkError("Request timeout")
+
+        client = make_client(failing)
+
+        with patch.object(server, "get_client", return_value=client):
+            result = orjson.loads(await server.get_dataset_pages("res", 1, 2, page_size=5))
+
+        assert result["error"] == "Request timeout"
+        assert len(result["errors"]) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("start_page, end_page, message", [
+        (0, 1, "start_page must be >= 1"),
+        (3, 2, "end_page must be >= start_page"),
+        (1, server.MAX_PAGES_PER_REQUEST + 1, "Cannot fetch more than"),
+    ])
+    async def test_page_bounds_rejected(self, start_page, end_page, message):
+        """Test that invalid page ranges are rejected without any request"""
+        client = make_client(page_of)
+
+        with patch.object(server, "get_client", return_value=client):
+            result = orjson.loads(await server.get_dataset_pages("res", start_page, end_page))
+
+        assert message in result["error"]
+        assert client.get_resource.await_count == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page_size", [0, -1, 101])
+    async def test_invalid_page_size_rejected(self, page_size):
+        """Test that page_size outside 1..max_limit fails before any request"""
+        client = make_client(page_of)
+
+        with patch.object(server, "get_client", return_value=client):
+            result = orjson.loads(await server.get_dataset_pages("res", 1, 2, page_size=page_size))
+
+        assert "Invalid parameter 'page_size'" in result["error"]
+        assert client.get_resource.await_count == 0